@@ -1,6 +1,8 @@
 import typing
+import struct
 from dataclasses import dataclass
 from solana.publickey import PublicKey
+from solders.pubkey import Pubkey
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
 import borsh_construct as borsh
@@ -16,12 +18,19 @@ class CounterJSON(typing.TypedDict):
     count: int
 
 
+_FIXED_LAYOUT = struct.Struct("<32sQ")
+
+
 @dataclass
 class Counter:
     discriminator: typing.ClassVar = b"\xff\xb0\x04\xf5\xbc\xfd|\x19"
     layout: typing.ClassVar = borsh.CStruct(
         "authority" / BorshPubkey, "count" / borsh.U64
     )
+    __slots__ = (
+        "authority",
+        "count",
+    )
     authority: PublicKey
     count: int
 
@@ -52,11 +61,12 @@ class Counter:
     ) -> typing.List[typing.Optional["Counter"]]:
         infos = await get_multiple_accounts(conn, addresses, commitment=commitment)
         res: typing.List[typing.Optional["Counter"]] = []
+        program_id_solders = program_id.to_solders()
         for info in infos:
             if info is None:
                 res.append(None)
                 continue
-            if info.account.owner != program_id:
+            if info.account.owner.to_solders() != program_id_solders:
                 raise ValueError("Account does not belong to this program")
             res.append(cls.decode(info.account.data))
         return res
@@ -67,15 +77,15 @@ class Counter:
             raise AccountInvalidDiscriminator(
                 "The discriminator for this account is invalid"
             )
-        dec = Counter.layout.parse(data[ACCOUNT_DISCRIMINATOR_SIZE:])
+        dec = _FIXED_LAYOUT.unpack_from(data, ACCOUNT_DISCRIMINATOR_SIZE)
         return cls(
-            authority=dec.authority,
-            count=dec.count,
+            authority=PublicKey.from_solders(Pubkey(dec[0])),
+            count=dec[1],
         )
 
     def to_json(self) -> CounterJSON:
         return {
-            "authority": str(self.authority),
+            "authority": str(self.authority.to_solders()),
             "count": self.count,
         }
 
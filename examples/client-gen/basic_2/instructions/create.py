@@ -1,5 +1,6 @@
 from __future__ import annotations
 import typing
+import struct
 from solana.publickey import PublicKey
 from solana.transaction import TransactionInstruction, AccountMeta
 from anchorpy.borsh_extension import BorshPubkey
@@ -12,6 +13,7 @@ class CreateArgs(typing.TypedDict):
 
 
 layout = borsh.CStruct("authority" / BorshPubkey)
+_FIXED_LAYOUT = struct.Struct("<32s")
 
 
 class CreateAccounts(typing.TypedDict):
@@ -32,10 +34,6 @@ def create(
     if remaining_accounts is not None:
         keys += remaining_accounts
     identifier = b"\x18\x1e\xc8(\x05\x1c\x07w"
-    encoded_args = layout.build(
-        {
-            "authority": args["authority"],
-        }
-    )
+    encoded_args = _FIXED_LAYOUT.pack(bytes(args["authority"]))
     data = identifier + encoded_args
     return TransactionInstruction(keys, program_id, data)
@@ -22,6 +22,5 @@ def increment(
     if remaining_accounts is not None:
         keys += remaining_accounts
     identifier = b"\x0b\x12h\th\xae;!"
-    encoded_args = b""
-    data = identifier + encoded_args
+    data = identifier
     return TransactionInstruction(keys, program_id, data)
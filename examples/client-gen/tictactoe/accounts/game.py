@@ -28,6 +28,12 @@ class Game:
         "board" / borsh.Option(types.sign.layout)[3][3],
         "state" / types.game_state.layout,
     )
+    __slots__ = (
+        "players",
+        "turn",
+        "board",
+        "state",
+    )
     players: list[PublicKey]
     turn: int
     board: list[list[typing.Optional[types.sign.SignKind]]]
@@ -60,11 +66,12 @@ class Game:
     ) -> typing.List[typing.Optional["Game"]]:
         infos = await get_multiple_accounts(conn, addresses, commitment=commitment)
         res: typing.List[typing.Optional["Game"]] = []
+        program_id_solders = program_id.to_solders()
         for info in infos:
             if info is None:
                 res.append(None)
                 continue
-            if info.account.owner != program_id:
+            if info.account.owner.to_solders() != program_id_solders:
                 raise ValueError("Account does not belong to this program")
             res.append(cls.decode(info.account.data))
         return res
@@ -97,7 +104,7 @@ class Game:
 
     def to_json(self) -> GameJSON:
         return {
-            "players": list(map(lambda item: str(item), self.players)),
+            "players": list(map(lambda item: str(item.to_solders()), self.players)),
             "turn": self.turn,
             "board": list(
                 map(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import typing
+import struct
 from solana.publickey import PublicKey
 from solana.transaction import TransactionInstruction, AccountMeta
 from anchorpy.borsh_extension import BorshPubkey
@@ -12,6 +13,7 @@ class SetupGameArgs(typing.TypedDict):
 
 
 layout = borsh.CStruct("player_two" / BorshPubkey)
+_FIXED_LAYOUT = struct.Struct("<32s")
 
 
 class SetupGameAccounts(typing.TypedDict):
@@ -36,10 +38,6 @@ def setup_game(
     if remaining_accounts is not None:
         keys += remaining_accounts
     identifier = b"\xb4\xda\x80K:\xde#R"
-    encoded_args = layout.build(
-        {
-            "player_two": args["player_two"],
-        }
-    )
+    encoded_args = _FIXED_LAYOUT.pack(bytes(args["player_two"]))
     data = identifier + encoded_args
     return TransactionInstruction(keys, program_id, data)
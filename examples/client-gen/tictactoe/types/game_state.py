@@ -73,7 +73,7 @@ class Won:
         return WonJSON(
             kind="Won",
             value={
-                "winner": str(self.value["winner"]),
+                "winner": str(self.value["winner"].to_solders()),
             },
         )
 
@@ -4,6 +4,7 @@ from keyword import kwlist
 from dataclasses import asdict
 from borsh_construct import CStruct, U8
 from solana import publickey
+from solders.pubkey import Pubkey
 from construct import (
     Bytes,
     Adapter,
@@ -21,7 +22,7 @@ class BorshPubkeyAdapter(Adapter):
         super().__init__(Bytes(32))  # type: ignore
 
     def _decode(self, obj: bytes, context, path) -> publickey.PublicKey:
-        return publickey.PublicKey(obj)
+        return publickey.PublicKey.from_solders(Pubkey(obj))
 
     def _encode(self, obj: publickey.PublicKey, context, path) -> bytes:
         return bytes(obj)
@@ -21,6 +21,7 @@ from anchorpy_core.idl import (
     IdlTypeDefinition,
     IdlTypeDefinitionTyStruct,
     IdlField,
+    IdlTypeSimple,
 )
 from anchorpy.coder.accounts import _account_discriminator
 from anchorpy.clientgen.genpy_extension import (
@@ -43,7 +44,10 @@ from anchorpy.clientgen.common import (
     _field_from_decoded,
     _field_to_json,
     _field_from_json,
+    _fixed_size_struct_format,
     _sanitize,
+    _write_file,
+    _write_files,
 )
 
 
@@ -55,29 +59,27 @@ def gen_accounts(idl: Idl, root: Path) -> None:
     accounts_dir.mkdir(exist_ok=True)
     gen_index_file(idl, accounts_dir)
     accounts_dict = gen_accounts_code(idl, accounts_dir)
+    fixed_files: dict[Path, str] = {}
     for path, code in accounts_dict.items():
         formatted = format_str(code, mode=FileMode())
-        fixed = fix_code(formatted, remove_all_unused_imports=True)
-        path.write_text(fixed)
+        fixed_files[path] = fix_code(formatted, remove_all_unused_imports=True)
+    _write_files(fixed_files)
 
 
 def gen_index_file(idl: Idl, accounts_dir: Path) -> None:
     code = gen_index_code(idl)
     formatted = format_str(code, mode=FileMode())
-    (accounts_dir / "__init__.py").write_text(formatted)
+    _write_file(accounts_dir / "__init__.py", formatted)
 
 
 def gen_index_code(idl: Idl) -> str:
-    imports: list[FromImport] = []
+    lines: list[str] = []
     for acc in idl.accounts:
         acc_name = _sanitize(acc.name)
-        members = [
-            acc_name,
-            _json_interface_name(acc_name),
-        ]
         module_name = _sanitize(snake(acc.name))
-        imports.append(FromImport(f".{module_name}", members))
-    return str(Collection(imports))
+        json_interface_name = _json_interface_name(acc_name)
+        lines.append(f"from .{module_name} import {acc_name}, {json_interface_name}")
+    return "\n".join(lines)
 
 
 def gen_accounts_code(idl: Idl, accounts_dir: Path) -> dict[Path, str]:
@@ -93,9 +95,11 @@ def gen_accounts_code(idl: Idl, accounts_dir: Path) -> dict[Path, str]:
 def gen_account_code(acc: IdlTypeDefinition, idl: Idl) -> str:
     base_imports = [
         Import("typing"),
+        Import("struct"),
         FromImport("dataclasses", ["dataclass"]),
         FromImport("construct", ["Construct"]),
         FromImport("solana.publickey", ["PublicKey"]),
+        FromImport("solders.pubkey", ["Pubkey"]),
         FromImport("solana.rpc.async_api", ["AsyncClient"]),
         FromImport("solana.rpc.commitment", ["Commitment"]),
         ImportAs("borsh_construct", "borsh"),
@@ -117,9 +121,10 @@ def gen_account_code(acc: IdlTypeDefinition, idl: Idl) -> str:
     layout_items: list[str] = []
     init_body_assignments: list[Assign] = []
     decode_body_entries: list[NamedArg] = []
+    fixed_decode_entries: list[NamedArg] = []
     to_json_entries: list[StrDictEntry] = []
     from_json_entries: list[NamedArg] = []
-    for field in fields:
+    for idx, field in enumerate(fields):
         field_name = _sanitize(snake(field.name))
         fields_interface_params.append(
             TypedParam(
@@ -157,6 +162,14 @@ def gen_account_code(acc: IdlTypeDefinition, idl: Idl) -> str:
                 ),
             )
         )
+        fixed_decode_entries.append(
+            NamedArg(
+                field_name,
+                f"PublicKey.from_solders(Pubkey(dec[{idx}]))"
+                if field.ty == IdlTypeSimple.PublicKey
+                else f"dec[{idx}]",
+            )
+        )
         to_json_entries.append(
             StrDictEntry(field_name, _field_to_json(idl, field, "self."))
         )
@@ -173,6 +186,8 @@ def gen_account_code(acc: IdlTypeDefinition, idl: Idl) -> str:
     layout_assignment = Assign(
         "layout: typing.ClassVar", f"borsh.CStruct({','.join(layout_items)})"
     )
+    slot_names = "".join(f'"{param.name}",' for param in fields_interface_params)
+    slots_assignment = Assign("__slots__", f"({slot_names})")
     fetch_method = ClassMethod(
         "fetch",
         [
@@ -222,6 +237,7 @@ def gen_account_code(acc: IdlTypeDefinition, idl: Idl) -> str:
                     ),
                 ),
                 Assign(f"res: {fetch_multiple_return_type}", "[]"),
+                Assign("program_id_solders", "program_id.to_solders()"),
                 For(
                     "info",
                     "infos",
@@ -232,7 +248,10 @@ def gen_account_code(acc: IdlTypeDefinition, idl: Idl) -> str:
                                 Suite([Statement("res.append(None)"), Continue()]),
                             ),
                             If(
-                                "info.account.owner != program_id",
+                                (
+                                    "info.account.owner.to_solders()"
+                                    " != program_id_solders"
+                                ),
                                 account_does_not_belong_raise,
                             ),
                             Statement("res.append(cls.decode(info.account.data))"),
@@ -245,25 +264,43 @@ def gen_account_code(acc: IdlTypeDefinition, idl: Idl) -> str:
         f'typing.List[typing.Optional["{name}"]]',
         is_async=True,
     )
-    decode_body_end = Call("cls", decode_body_entries)
     account_invalid_raise = Raise(
         'AccountInvalidDiscriminator("The discriminator for this account is invalid")'
     )
-    decode_method = ClassMethod(
-        "decode",
-        [TypedParam("data", "bytes")],
-        Suite(
+    discriminator_check = If(
+        "data[:ACCOUNT_DISCRIMINATOR_SIZE] != cls.discriminator",
+        account_invalid_raise,
+    )
+    fixed_format = _fixed_size_struct_format([field.ty for field in fields])
+    if fixed_format is None:
+        fixed_layout_container = []
+        decode_body = Suite(
             [
-                If(
-                    "data[:ACCOUNT_DISCRIMINATOR_SIZE] != cls.discriminator",
-                    account_invalid_raise,
-                ),
+                discriminator_check,
                 Assign(
                     "dec", f"{name}.layout.parse(data[ACCOUNT_DISCRIMINATOR_SIZE:])"
                 ),
-                Return(decode_body_end),
+                Return(Call("cls", decode_body_entries)),
             ]
-        ),
+        )
+    else:
+        fixed_layout_container = [
+            Assign("_FIXED_LAYOUT", f'struct.Struct("{fixed_format}")')
+        ]
+        decode_body = Suite(
+            [
+                discriminator_check,
+                Assign(
+                    "dec",
+                    "_FIXED_LAYOUT.unpack_from(data, ACCOUNT_DISCRIMINATOR_SIZE)",
+                ),
+                Return(Call("cls", fixed_decode_entries)),
+            ]
+        )
+    decode_method = ClassMethod(
+        "decode",
+        [TypedParam("data", "bytes")],
+        decode_body,
         f'"{name}"',
     )
     to_json_body = StrDict(to_json_entries)
@@ -280,6 +317,7 @@ def gen_account_code(acc: IdlTypeDefinition, idl: Idl) -> str:
         [
             discriminator_assignment,
             layout_assignment,
+            slots_assignment,
             *fields_interface_params,
             fetch_method,
             fetch_multiple_method,
@@ -293,6 +331,7 @@ def gen_account_code(acc: IdlTypeDefinition, idl: Idl) -> str:
             [
                 *imports,
                 json_interface,
+                *fixed_layout_container,
                 klass,
             ]
         )
@@ -1,5 +1,7 @@
 """Code generation utilities."""
-from typing import Optional
+from typing import Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import keyword
 from pyheck import snake
 from anchorpy_core.idl import (
@@ -30,6 +32,22 @@ INT_TYPES = {
 }
 FLOAT_TYPES = {IdlTypeSimple.F32, IdlTypeSimple.F64}
 NUMBER_TYPES = INT_TYPES | FLOAT_TYPES
+# struct module format characters for the fixed-size simple types.
+# u128/i128 have no struct equivalent so they are left out.
+FIXED_SIZE_FORMATS: dict[IdlType, str] = {
+    IdlTypeSimple.Bool: "?",
+    IdlTypeSimple.U8: "B",
+    IdlTypeSimple.I8: "b",
+    IdlTypeSimple.U16: "H",
+    IdlTypeSimple.I16: "h",
+    IdlTypeSimple.U32: "I",
+    IdlTypeSimple.I32: "i",
+    IdlTypeSimple.U64: "Q",
+    IdlTypeSimple.I64: "q",
+    IdlTypeSimple.F32: "f",
+    IdlTypeSimple.F64: "d",
+    IdlTypeSimple.PublicKey: "32s",
+}
 
 
 def _fields_interface_name(type_name: str) -> str:
@@ -52,6 +70,32 @@ def _sanitize(name: str) -> str:
     return f"{name}_" if keyword.iskeyword(name) else name
 
 
+def _write_file(path: Path, code: str) -> None:
+    # encode once and skip the text IO layer
+    path.write_bytes(code.encode())
+
+
+def _write_files(files: dict[Path, str]) -> None:
+    if not files:
+        return
+    # file writes release the GIL, so a thread pool overlaps them
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+        list(executor.map(_write_file, files.keys(), files.values()))
+
+
+def _fixed_size_struct_format(types: list[IdlType]) -> Optional[str]:
+    """Get a little-endian struct format for a run of fixed-size primitives.
+
+    Generated code packs and unpacks such layouts with struct.Struct
+    instead of going through the construct builder and parser.
+    Returns None if any type has no fixed-size struct code.
+    """
+    formats = [FIXED_SIZE_FORMATS.get(ty) for ty in types]
+    if not formats or None in formats:
+        return None
+    return "<" + "".join(cast(list[str], formats))
+
+
 def _py_type_from_idl(
     idl: Idl,
     ty: IdlType,
@@ -381,7 +425,8 @@ def _field_to_json(
     maybe_converted = snake(ty.name) if convert_case else ty.name
     var_name = f"{val_prefix}{maybe_converted}{val_suffix}"
     if ty_type == IdlTypeSimple.PublicKey:
-        return f"str({var_name})"
+        # PublicKey.__str__ round-trips through bytes, the solders key doesn't
+        return f"str({var_name}.to_solders())"
     if isinstance(ty_type, IdlTypeVec):
         map_body = _field_to_json(idl, IdlField("item", docs=None, ty=ty_type.vec))
         # skip mapping when not needed
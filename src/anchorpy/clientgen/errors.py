@@ -23,7 +23,7 @@ from anchorpy.clientgen.genpy_extension import (
     IntDict,
     IntDictEntry,
 )
-from anchorpy.clientgen.common import _sanitize
+from anchorpy.clientgen.common import _sanitize, _write_file
 
 
 def gen_from_code_fn(has_custom_errors: bool) -> Function:
@@ -126,7 +126,7 @@ def gen_custom_errors(idl: Idl, errors_dir: Path) -> None:
     code = gen_custom_errors_code(errors)
     formatted = format_str(code, mode=FileMode())
     fixed = fix_code(formatted, remove_all_unused_imports=True)
-    (errors_dir / "custom.py").with_suffix(".py").write_text(fixed)
+    _write_file(errors_dir / "custom.py", fixed)
 
 
 def gen_anchor_errors_code() -> str:
@@ -179,7 +179,7 @@ def gen_anchor_errors_code() -> str:
 def gen_anchor_errors(errors_dir: Path) -> None:
     code = gen_anchor_errors_code()
     formatted = format_str(code, mode=FileMode())
-    (errors_dir / "anchor").with_suffix(".py").write_text(formatted)
+    _write_file(errors_dir / "anchor.py", formatted)
 
 
 def gen_index_code(idl: Idl) -> str:
@@ -232,7 +232,7 @@ def gen_index_file(idl: Idl, errors_dir: Path) -> None:
     code = gen_index_code(idl)
     path = errors_dir / "__init__.py"
     formatted = format_str(code, mode=FileMode())
-    path.write_text(formatted)
+    _write_file(path, formatted)
 
 
 def gen_errors(idl: Idl, root: Path) -> None:
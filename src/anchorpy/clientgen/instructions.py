@@ -1,8 +1,10 @@
 from typing import cast, Optional
+from collections import Counter
+from functools import lru_cache
 from black import format_str, FileMode
 from autoflake import fix_code
 from pathlib import Path
-from pyheck import upper_camel, snake
+from pyheck import upper_camel as _upper_camel_uncached, snake
 from genpy import (
     Import,
     FromImport,
@@ -19,13 +21,15 @@ from anchorpy_core.idl import (
     Idl,
     IdlAccounts,
     IdlAccountItem,
+    IdlInstruction,
+    IdlType,
+    IdlTypeSimple,
 )
 from anchorpy.clientgen.genpy_extension import (
     TypedParam,
     TypedDict,
     StrDict,
     StrDictEntry,
-    List,
     Function,
     ANNOTATIONS_IMPORT,
 )
@@ -33,30 +37,36 @@ from anchorpy.clientgen.common import (
     _py_type_from_idl,
     _layout_for_type,
     _field_to_encodable,
+    _fixed_size_struct_format,
     _sanitize,
+    _write_file,
+    _write_files,
 )
 
+upper_camel = lru_cache(maxsize=None)(_upper_camel_uncached)
+
 
 def gen_instructions(idl: Idl, root: Path) -> None:
     instructions_dir = root / "instructions"
     instructions_dir.mkdir(exist_ok=True)
     gen_index_file(idl, instructions_dir)
     instructions = gen_instructions_code(idl, instructions_dir)
+    fixed_files: dict[Path, str] = {}
     for path, code in instructions.items():
         formatted = format_str(code, mode=FileMode())
-        fixed = fix_code(formatted, remove_all_unused_imports=True)
-        path.write_text(fixed)
+        fixed_files[path] = fix_code(formatted, remove_all_unused_imports=True)
+    _write_files(fixed_files)
 
 
 def gen_index_file(idl: Idl, instructions_dir: Path) -> None:
     code = gen_index_code(idl)
     path = instructions_dir / "__init__.py"
     formatted = format_str(code, mode=FileMode())
-    path.write_text(formatted)
+    _write_file(path, formatted)
 
 
 def gen_index_code(idl: Idl) -> str:
-    imports: list[FromImport] = []
+    lines: list[str] = []
     for ix in idl.instructions:
         ix_name_snake_unsanitized = snake(ix.name)
         ix_name = _sanitize(ix_name_snake_unsanitized)
@@ -65,9 +75,8 @@ def gen_index_code(idl: Idl) -> str:
             import_members.append(_args_interface_name(ix_name_snake_unsanitized))
         if ix.accounts:
             import_members.append(_accounts_interface_name(ix_name_snake_unsanitized))
-        if import_members:
-            imports.append(FromImport(f".{ix_name}", import_members))
-    return str(Collection(imports))
+        lines.append(f"from .{ix_name} import {', '.join(import_members)}")
+    return "\n".join(lines)
 
 
 def _args_interface_name(ix_name: str) -> str:
@@ -78,22 +87,25 @@ def _accounts_interface_name(ix_name: str) -> str:
     return f"{upper_camel(ix_name)}Accounts"
 
 
-def recurse_accounts(accs: list[IdlAccountItem], nested_names: list[str]) -> list[str]:
-    elements: list[str] = []
+_ACCOUNT_META_TEMPLATE = "AccountMeta(pubkey=accounts{}, is_signer={}, is_writable={})"
+
+
+def recurse_accounts(
+    accs: list[IdlAccountItem],
+    prefix: str,
+    elements: Optional[list[str]] = None,
+) -> list[str]:
+    elements_to_use = [] if elements is None else elements
     for acc in accs:
-        names = [*nested_names, _sanitize(snake(acc.name))]
+        dict_accessor = f'{prefix}["{_sanitize(snake(acc.name))}"]'
         if isinstance(acc, IdlAccounts):
             nested_accs = cast(IdlAccounts, acc)
-            elements.extend(recurse_accounts(nested_accs.accounts, names))
+            recurse_accounts(nested_accs.accounts, dict_accessor, elements_to_use)
         else:
-            nested_keys = [f'["{key}"]' for key in names]
-            dict_accessor = "".join(nested_keys)
-            elements.append(
-                f"AccountMeta(pubkey=accounts{dict_accessor}, "
-                f"is_signer={acc.is_signer}, "
-                f"is_writable={acc.is_mut})"
+            elements_to_use.append(
+                _ACCOUNT_META_TEMPLATE.format(dict_accessor, acc.is_signer, acc.is_mut)
             )
-    return elements
+    return elements_to_use
 
 
 def gen_accounts(
@@ -103,23 +115,48 @@ def gen_accounts(
 ) -> list[TypedDict]:
     extra_typeddicts_to_use = [] if extra_typeddicts is None else extra_typeddicts
     params: list[TypedParam] = []
+    nested_to_gen: list[tuple[str, list[IdlAccountItem]]] = []
     for acc in idl_accs:
         acc_name = _sanitize(snake(acc.name))
         if isinstance(acc, IdlAccounts):
             nested_accs = cast(IdlAccounts, acc)
             nested_acc_name = f"{upper_camel(nested_accs.name)}Nested"
             params.append(TypedParam(acc_name, f"{nested_acc_name}"))
-            extra_typeddicts_to_use = extra_typeddicts_to_use + (
-                gen_accounts(
-                    nested_acc_name,
-                    nested_accs.accounts,
-                    extra_typeddicts_to_use,
-                )
-            )
+            nested_to_gen.append((nested_acc_name, nested_accs.accounts))
         else:
             params.append(TypedParam(acc_name, "PublicKey"))
-    maybe_typed_dict_container = [TypedDict(name, params)] if params else []
-    return maybe_typed_dict_container + extra_typeddicts_to_use
+    if params:
+        extra_typeddicts_to_use.append(TypedDict(name, params))
+    for nested_acc_name, nested_idl_accs in nested_to_gen:
+        gen_accounts(nested_acc_name, nested_idl_accs, extra_typeddicts_to_use)
+    return extra_typeddicts_to_use
+
+
+def _args_layout(idl: Idl, ix: IdlInstruction, layouts: dict[IdlType, str]) -> str:
+    layout_items: list[str] = []
+    for arg in ix.args:
+        layout = layouts.get(arg.ty)
+        if layout is None:
+            layout = _layout_for_type(idl=idl, ty=arg.ty, types_relative_imports=False)
+            layouts[arg.ty] = layout
+        layout_items.append(f'"{_sanitize(snake(arg.name))}" / {layout}')
+    return f"borsh.CStruct({','.join(layout_items)})"
+
+
+def gen_shared_layouts_code(idl: Idl, shared_layouts: dict[str, str]) -> str:
+    types_import = [FromImport("..", ["types"])] if idl.types else []
+    imports = [
+        Import("typing"),
+        FromImport("anchorpy.borsh_extension", ["EnumForCodegen", "BorshPubkey"]),
+        FromImport("construct", ["Construct"]),
+        ImportAs("borsh_construct", "borsh"),
+        *types_import,
+    ]
+    assignments = [
+        Assign(layout_name, layout_val)
+        for layout_val, layout_name in shared_layouts.items()
+    ]
+    return str(Collection([*imports, *assignments]))
 
 
 def gen_instructions_code(idl: Idl, out: Path) -> dict[Path, str]:
@@ -127,6 +164,7 @@ def gen_instructions_code(idl: Idl, out: Path) -> dict[Path, str]:
     imports = [
         ANNOTATIONS_IMPORT,
         Import("typing"),
+        Import("struct"),
         FromImport("solana.publickey", ["PublicKey"]),
         FromImport("solana.transaction", ["TransactionInstruction", "AccountMeta"]),
         FromImport("anchorpy.borsh_extension", ["EnumForCodegen", "BorshPubkey"]),
@@ -136,32 +174,40 @@ def gen_instructions_code(idl: Idl, out: Path) -> dict[Path, str]:
         FromImport("..program_id", ["PROGRAM_ID"]),
     ]
     result = {}
+    # compound IDL types compare by identity, so these only hit for simple
+    # and defined types, which are the ones that repeat across instructions.
+    py_types: dict[IdlType, str] = {}
+    layouts: dict[IdlType, str] = {}
+    args_layouts = {
+        ix.name: _args_layout(idl, ix, layouts) for ix in idl.instructions if ix.args
+    }
+    # identical arg layouts are built once in _layouts.py and imported
+    layout_counts = Counter(args_layouts.values())
+    shared_layout_vals = [val for val, count in layout_counts.items() if count > 1]
+    shared_layouts = {
+        layout_val: f"layout_{idx}" for idx, layout_val in enumerate(shared_layout_vals)
+    }
+    if shared_layouts:
+        result[out / "_layouts.py"] = gen_shared_layouts_code(idl, shared_layouts)
     for ix in idl.instructions:
         ix_name_snake_unsanitized = snake(ix.name)
         ix_name = _sanitize(ix_name_snake_unsanitized)
         filename = (out / ix_name).with_suffix(".py")
         args_interface_params: list[TypedParam] = []
-        layout_items: list[str] = []
         encoded_args_entries: list[StrDictEntry] = []
         accounts_interface_name = _accounts_interface_name(ix_name_snake_unsanitized)
         for arg in ix.args:
             arg_name = _sanitize(snake(arg.name))
-            args_interface_params.append(
-                TypedParam(
-                    arg_name,
-                    _py_type_from_idl(
-                        idl=idl,
-                        ty=arg.ty,
-                        types_relative_imports=False,
-                        use_fields_interface_for_struct=False,
-                    ),
+            py_type = py_types.get(arg.ty)
+            if py_type is None:
+                py_type = _py_type_from_idl(
+                    idl=idl,
+                    ty=arg.ty,
+                    types_relative_imports=False,
+                    use_fields_interface_for_struct=False,
                 )
-            )
-            layout_items.append(
-                _layout_for_type(
-                    idl=idl, ty=arg.ty, name=arg_name, types_relative_imports=False
-                )
-            )
+                py_types[arg.ty] = py_type
+            args_interface_params.append(TypedParam(arg_name, py_type))
             encoded_args_entries.append(
                 StrDictEntry(
                     arg_name,
@@ -174,27 +220,49 @@ def gen_instructions_code(idl: Idl, out: Path) -> dict[Path, str]:
                     ),
                 )
             )
+        encoded_args_val: Optional[str]
+        shared_layout_import: list[FromImport] = []
         if ix.args:
             args_interface_name = _args_interface_name(ix_name)
             args_interface_container = [
                 TypedDict(args_interface_name, args_interface_params)
             ]
-            layout_val = f"borsh.CStruct({','.join(layout_items)})"
-            layout_assignment_container = [Assign("layout", layout_val)]
+            layout_val = args_layouts[ix.name]
+            shared_layout_name = shared_layouts.get(layout_val)
+            if shared_layout_name is None:
+                layout_assignment_container = [Assign("layout", layout_val)]
+            else:
+                shared_layout_import = [FromImport(".", ["_layouts"])]
+                layout_assignment_container = [
+                    Assign("layout", f"_layouts.{shared_layout_name}")
+                ]
             args_container = [TypedParam("args", args_interface_name)]
-            encoded_args_val = f"layout.build({StrDict(encoded_args_entries)})"
+            fixed_format = _fixed_size_struct_format([arg.ty for arg in ix.args])
+            if fixed_format is None:
+                encoded_args_val = f"layout.build({StrDict(encoded_args_entries)})"
+            else:
+                layout_assignment_container.append(
+                    Assign("_FIXED_LAYOUT", f'struct.Struct("{fixed_format}")')
+                )
+                pack_args = ", ".join(
+                    f'bytes(args["{_sanitize(snake(arg.name))}"])'
+                    if arg.ty == IdlTypeSimple.PublicKey
+                    else f'args["{_sanitize(snake(arg.name))}"]'
+                    for arg in ix.args
+                )
+                encoded_args_val = f"_FIXED_LAYOUT.pack({pack_args})"
         else:
             args_interface_container = []
-            layout_val = "Pass"
             args_container = []
             layout_assignment_container = []
-            encoded_args_val = 'b""'
+            encoded_args_val = None
         accounts_container = (
             [TypedParam("accounts", accounts_interface_name)] if ix.accounts else []
         )
         accounts = gen_accounts(accounts_interface_name, ix.accounts)
         keys_assignment = Assign(
-            "keys: list[AccountMeta]", f"{List(recurse_accounts(ix.accounts, []))}"
+            "keys: list[AccountMeta]",
+            f"[{','.join(recurse_accounts(ix.accounts, ''))}]",
         )
         remaining_accounts_concatenation = If(
             "remaining_accounts is not None", Line("keys += remaining_accounts")
@@ -202,8 +270,15 @@ def gen_instructions_code(idl: Idl, out: Path) -> dict[Path, str]:
         identifier_assignment = Assign(
             "identifier", _sighash(ix_name_snake_unsanitized)
         )
-        encoded_args_assignment = Assign("encoded_args", encoded_args_val)
-        data_assignment = Assign("data", "identifier + encoded_args")
+        # instructions without args send the identifier as-is, no concatenation
+        data_assignments = (
+            [Assign("data", "identifier")]
+            if encoded_args_val is None
+            else [
+                Assign("encoded_args", encoded_args_val),
+                Assign("data", "identifier + encoded_args"),
+            ]
+        )
         returning = Return("TransactionInstruction(keys, program_id, data)")
         ix_fn = Function(
             ix_name,
@@ -221,8 +296,7 @@ def gen_instructions_code(idl: Idl, out: Path) -> dict[Path, str]:
                     keys_assignment,
                     remaining_accounts_concatenation,
                     identifier_assignment,
-                    encoded_args_assignment,
-                    data_assignment,
+                    *data_assignments,
                     returning,
                 ]
             ),
@@ -231,6 +305,7 @@ def gen_instructions_code(idl: Idl, out: Path) -> dict[Path, str]:
         contents = Collection(
             [
                 *imports,
+                *shared_layout_import,
                 *args_interface_container,
                 *layout_assignment_container,
                 *accounts,
@@ -2,6 +2,7 @@ from pathlib import Path
 from black import format_str, FileMode
 from genpy import Assign, FromImport, Collection
 from anchorpy_core.idl import Idl
+from anchorpy.clientgen.common import _write_file
 
 
 def gen_program_id_code(idl: Idl, program_id: str) -> str:
@@ -13,4 +14,4 @@ def gen_program_id_code(idl: Idl, program_id: str) -> str:
 def gen_program_id(idl: Idl, program_id: str, root: Path) -> None:
     code = gen_program_id_code(idl, program_id)
     formatted = format_str(code, mode=FileMode())
-    (root / "program_id.py").write_text(formatted)
+    _write_file(root / "program_id.py", formatted)
@@ -51,6 +51,8 @@ from anchorpy.clientgen.common import (
     _field_to_json,
     _field_from_json,
     _sanitize,
+    _write_file,
+    _write_files,
 )
 
 
@@ -68,7 +70,7 @@ def gen_index_file(idl: Idl, types_dir: Path) -> None:
     code = gen_index_code(idl)
     path = types_dir / "__init__.py"
     formatted = format_str(code, mode=FileMode())
-    path.write_text(formatted)
+    _write_file(path, formatted)
 
 
 def gen_index_code(idl: Idl) -> str:
@@ -98,10 +100,11 @@ def gen_index_code(idl: Idl) -> str:
 
 def gen_type_files(idl: Idl, types_dir: Path) -> None:
     types_code = gen_types_code(idl, types_dir)
+    fixed_files: dict[Path, str] = {}
     for path, code in types_code.items():
         formatted = format_str(code, mode=FileMode())
-        fixed = fix_code(formatted, remove_all_unused_imports=True)
-        path.write_text(fixed)
+        fixed_files[path] = fix_code(formatted, remove_all_unused_imports=True)
+    _write_files(fixed_files)
 
 
 def gen_types_code(idl: Idl, out: Path) -> dict[Path, str]:
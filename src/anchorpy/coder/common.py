@@ -1,6 +1,7 @@
 """Common utilities for encoding and decoding."""
 from typing import Dict, Union
 from hashlib import sha256
+from functools import lru_cache
 
 from anchorpy_core.idl import (
     Idl,
@@ -18,6 +19,7 @@ from anchorpy_core.idl import (
 )
 
 
+@lru_cache(maxsize=None)
 def _sighash(ix_name: str) -> bytes:
     """Not technically sighash, since we don't include the arguments.
 
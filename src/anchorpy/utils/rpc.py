@@ -1,6 +1,5 @@
 """This module contains the invoke function."""
 from dataclasses import dataclass
-from base64 import b64decode
 from asyncio import gather
 from typing import Any, Optional, NamedTuple
 from solana.rpc.core import RPCException
@@ -19,6 +18,11 @@ import jsonrpcclient
 from anchorpy.program.common import AddressType, translate_address
 from anchorpy.provider import Provider
 
+try:
+    from pybase64 import b64decode  # noqa: WPS433
+except ImportError:
+    from base64 import b64decode  # type: ignore  # noqa: WPS433,WPS440
+
 _GET_MULTIPLE_ACCOUNTS_LIMIT = 100
 _MAX_ACCOUNT_SIZE = 10 * 1048576
 
@@ -84,6 +88,11 @@ async def get_multiple_accounts(
 ) -> list[Optional[_MultipleAccountsItem]]:
     """Fetch multiple account infos through batched `getMultipleAccount` RPC requests.
 
+    The pubkeys are split into `getMultipleAccounts` calls of at most 100 addresses
+    (the RPC limit), `batch_size` of which are sent per HTTP request. The HTTP
+    requests are made concurrently and each response is decoded as soon as it
+    arrives, so decoding overlaps with the remaining round trips.
+
     Args:
         connection: The `solana-py` client object.
         pubkeys: Pubkeys to fetch.
@@ -126,33 +135,28 @@ async def _get_multiple_accounts_core(
         headers={"content-encoding": "gzip"},
     )
     parsed = jsonrpcclient.parse(resp.json())
-    result: list[Optional[_MultipleAccountsItem]] = []
-    dctx = zstandard.ZstdDecompressor()
-    idx = 0
+    accounts: list[Optional[dict[str, Any]]] = []
     for rpc_result in parsed:
         if isinstance(rpc_result, jsonrpcclient.Error):
             raise RPCException(
                 f"Failed to get info about accounts: {rpc_result.message}"
             )
-        for account in rpc_result.result["value"]:
-            if account is None:
-                result.append(None)
-            else:
-                acc_info_data = account["data"][0]
-                decoded = b64decode(acc_info_data)
-                decompressed = dctx.decompress(
-                    decoded, max_output_size=_MAX_ACCOUNT_SIZE
-                )
-                acc_info = AccountInfo(
-                    executable=account["executable"],
-                    owner=PublicKey(account["owner"]),
-                    lamports=account["lamports"],
-                    data=decompressed,
-                    rent_epoch=account["rentEpoch"],
-                )
-                multiple_accounts_item = _MultipleAccountsItem(
-                    pubkey=pubkeys[idx], account=acc_info
-                )
-                result.append(multiple_accounts_item)
-            idx += 1
+        accounts.extend(rpc_result.result["value"])
+    dctx = zstandard.ZstdDecompressor()
+    result: list[Optional[_MultipleAccountsItem]] = []
+    for pubkey, account in zip(pubkeys, accounts):
+        if account is None:
+            result.append(None)
+        else:
+            decompressed = dctx.decompress(
+                b64decode(account["data"][0]), max_output_size=_MAX_ACCOUNT_SIZE
+            )
+            acc_info = AccountInfo(
+                executable=account["executable"],
+                owner=PublicKey(account["owner"]),
+                lamports=account["lamports"],
+                data=decompressed,
+                rent_epoch=account["rentEpoch"],
+            )
+            result.append(_MultipleAccountsItem(pubkey=pubkey, account=acc_info))
     return result
@@ -74,6 +74,34 @@ class State:
         "enum_field3" / types.foo_enum.layout,
         "enum_field4" / types.foo_enum.layout,
     )
+    __slots__ = (
+        "bool_field",
+        "u8_field",
+        "i8_field",
+        "u16_field",
+        "i16_field",
+        "u32_field",
+        "i32_field",
+        "f32_field",
+        "u64_field",
+        "i64_field",
+        "f64_field",
+        "u128_field",
+        "i128_field",
+        "bytes_field",
+        "string_field",
+        "pubkey_field",
+        "vec_field",
+        "vec_struct_field",
+        "option_field",
+        "option_struct_field",
+        "struct_field",
+        "array_field",
+        "enum_field1",
+        "enum_field2",
+        "enum_field3",
+        "enum_field4",
+    )
     bool_field: bool
     u8_field: int
     i8_field: int
@@ -128,11 +156,12 @@ class State:
     ) -> typing.List[typing.Optional["State"]]:
         infos = await get_multiple_accounts(conn, addresses, commitment=commitment)
         res: typing.List[typing.Optional["State"]] = []
+        program_id_solders = program_id.to_solders()
         for info in infos:
             if info is None:
                 res.append(None)
                 continue
-            if info.account.owner != program_id:
+            if info.account.owner.to_solders() != program_id_solders:
                 raise ValueError("Account does not belong to this program")
             res.append(cls.decode(info.account.data))
         return res
@@ -199,7 +228,7 @@ class State:
             "i128_field": self.i128_field,
             "bytes_field": list(self.bytes_field),
             "string_field": self.string_field,
-            "pubkey_field": str(self.pubkey_field),
+            "pubkey_field": str(self.pubkey_field.to_solders()),
             "vec_field": self.vec_field,
             "vec_struct_field": list(
                 map(lambda item: item.to_json(), self.vec_struct_field)
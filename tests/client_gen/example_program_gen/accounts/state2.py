@@ -21,6 +21,7 @@ class State2:
     layout: typing.ClassVar = borsh.CStruct(
         "vec_of_option" / borsh.Vec(typing.cast(Construct, borsh.Option(borsh.U64)))
     )
+    __slots__ = ("vec_of_option",)
     vec_of_option: list[typing.Optional[int]]
 
     @classmethod
@@ -50,11 +51,12 @@ class State2:
     ) -> typing.List[typing.Optional["State2"]]:
         infos = await get_multiple_accounts(conn, addresses, commitment=commitment)
         res: typing.List[typing.Optional["State2"]] = []
+        program_id_solders = program_id.to_solders()
         for info in infos:
             if info is None:
                 res.append(None)
                 continue
-            if info.account.owner != program_id:
+            if info.account.owner.to_solders() != program_id_solders:
                 raise ValueError("Account does not belong to this program")
             res.append(cls.decode(info.account.data))
         return res
@@ -13,6 +13,5 @@ def cause_error(
     if remaining_accounts is not None:
         keys += remaining_accounts
     identifier = b"Ch%\x11\x02\x9bD\x11"
-    encoded_args = b""
-    data = identifier + encoded_args
+    data = identifier
     return TransactionInstruction(keys, program_id, data)
@@ -38,6 +38,5 @@ def initialize(
     if remaining_accounts is not None:
         keys += remaining_accounts
     identifier = b"\xaf\xafm\x1f\r\x98\x9b\xed"
-    encoded_args = b""
-    data = identifier + encoded_args
+    data = identifier
     return TransactionInstruction(keys, program_id, data)
@@ -1,9 +1,48 @@
+import importlib
+import sys
 from pathlib import Path
+from typing import Iterator
 from genpy import Suite
+from pytest import TempPathFactory, fixture
+from solana.publickey import PublicKey
 from anchorpy import Idl
-from anchorpy.clientgen.instructions import gen_accounts
+from anchorpy_core.idl import IdlTypeSimple, IdlTypeVec
+from anchorpy.cli import client_gen
+from anchorpy.clientgen.common import _fixed_size_struct_format
+from anchorpy.clientgen.instructions import gen_accounts, gen_instructions_code
 from anchorpy.clientgen.types import gen_struct
 
+FIXED_SIZE_VALUES = {
+    "flag": True,
+    "u8_val": 255,
+    "i8_val": -128,
+    "u16_val": 65535,
+    "i16_val": -32768,
+    "u32_val": 4294967295,
+    "i32_val": -2147483648,
+    "u64_val": 18446744073709551615,
+    "i64_val": -9223372036854775808,
+    "f32_val": 1.5,
+    "f64_val": -2.25,
+    "owner": PublicKey("3rTQ3R4B2PxZrAyx7EUefySPgZY8RhJf16cZajbmrzp8"),
+}
+
+
+@fixture(scope="module")
+def fixed_size_client(tmp_path_factory: TempPathFactory) -> Iterator[str]:
+    tmpdir = tmp_path_factory.mktemp("fixed_size")
+    client_gen(
+        Path("tests/idls/fixed_size.json"),
+        tmpdir / "fixed_size_client",
+        "3rTQ3R4B2PxZrAyx7EUefySPgZY8RhJf16cZajbmrzp8",
+    )
+    sys.path.insert(0, str(tmpdir))
+    yield "fixed_size_client"
+    sys.path.remove(str(tmpdir))
+    for name in list(sys.modules):
+        if name.startswith("fixed_size_client"):
+            del sys.modules[name]
+
 
 def test_gen_accounts() -> None:
     path = Path("tests/idls/composite.json")
@@ -19,8 +58,6 @@ def test_gen_accounts() -> None:
         "\n        dummy_a: PublicKey"
         "\n    class BarNested(typing.TypedDict):"
         "\n        dummy_b: PublicKey"
-        "\n    class FooNested(typing.TypedDict):"
-        "\n        dummy_a: PublicKey"
     )
 
 
@@ -52,3 +89,46 @@ def test_empty_fields() -> None:
         '\n    def from_json(cls, obj: AggregatorLockParamsJSON) -> "AggregatorLockParams":'
         '\n        return cls()'
     )
+
+
+def test_fixed_size_struct_format() -> None:
+    assert (
+        _fixed_size_struct_format([IdlTypeSimple.PublicKey, IdlTypeSimple.U64])
+        == "<32sQ"
+    )
+    assert _fixed_size_struct_format([IdlTypeSimple.Bool, IdlTypeSimple.F32]) == "<?f"
+    assert _fixed_size_struct_format([IdlTypeSimple.U128]) is None
+    assert _fixed_size_struct_format([IdlTypeVec(IdlTypeSimple.U8)]) is None
+    assert _fixed_size_struct_format([]) is None
+
+
+def test_shared_instruction_layouts() -> None:
+    path = Path("tests/idls/quarry_mine.json")
+    raw = path.read_text()
+    idl = Idl.from_json(raw)
+    out = Path("instructions")
+    code = gen_instructions_code(idl, out)
+    assert code[out / "_layouts.py"].splitlines()[-2:] == [
+        'layout_0 = borsh.CStruct("bump" / borsh.U8)',
+        'layout_1 = borsh.CStruct("amount" / borsh.U64)',
+    ]
+    assert "layout = _layouts.layout_1" in code[out / "stake_tokens.py"]
+    assert "layout = _layouts.layout_1" in code[out / "withdraw_tokens.py"]
+
+
+def test_fixed_size_instruction_pack(fixed_size_client: str) -> None:
+    mod = importlib.import_module(f"{fixed_size_client}.instructions.set_values")
+    accounts = {"values": FIXED_SIZE_VALUES["owner"]}
+    ix = mod.set_values(FIXED_SIZE_VALUES, accounts)
+    assert hasattr(mod, "_FIXED_LAYOUT")
+    assert ix.data[8:] == mod.layout.build(FIXED_SIZE_VALUES)
+
+
+def test_fixed_size_account_unpack(fixed_size_client: str) -> None:
+    mod = importlib.import_module(f"{fixed_size_client}.accounts.values")
+    data = mod.Values.discriminator + mod.Values.layout.build(FIXED_SIZE_VALUES)
+    decoded = mod.Values.decode(data)
+    parsed = mod.Values.layout.parse(data[8:])
+    assert hasattr(mod, "_FIXED_LAYOUT")
+    for field, expected in FIXED_SIZE_VALUES.items():
+        assert getattr(decoded, field) == parsed[field] == expected
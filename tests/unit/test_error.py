@@ -0,0 +1,74 @@
+import json
+from typing import Optional
+from pytest import mark
+from solders.rpc.errors import SendTransactionPreflightFailureMessage
+from solders.rpc.responses import SimulateTransactionResp
+from solana.publickey import PublicKey
+from anchorpy.error import _find_first_match, extract_code_and_logs
+
+PROGRAM_ID = PublicKey("3rTQ3R4B2PxZrAyx7EUefySPgZY8RhJf16cZajbmrzp8")
+ERROR_LINE = f"Program {PROGRAM_ID} failed: custom program error: 0x1770"
+NOISE_LINES = [
+    f"Program {PROGRAM_ID} invoke [1]",
+    "Program log: Instruction: CauseError",
+    f"Program {PROGRAM_ID} consumed 5043 of 1400000 compute units",
+]
+
+
+def _preflight_failure(logs: list[str]) -> SendTransactionPreflightFailureMessage:
+    to_dump = {
+        "jsonrpc": "2.0",
+        "error": {
+            "code": -32002,
+            "message": "",
+            "data": {
+                "err": {"InstructionError": [0, {"Custom": 6000}]},
+                "logs": logs,
+            },
+        },
+    }
+    parsed = SimulateTransactionResp.from_json(json.dumps(to_dump))
+    assert isinstance(parsed, SendTransactionPreflightFailureMessage)
+    return parsed
+
+
+@mark.parametrize(
+    "logs,expected",
+    [
+        ([ERROR_LINE, *NOISE_LINES], ERROR_LINE),
+        ([*NOISE_LINES, ERROR_LINE], ERROR_LINE),
+        (NOISE_LINES, None),
+    ],
+    ids=["first_line", "later_line", "no_match"],
+)
+def test_find_first_match(logs: list[str], expected: Optional[str]) -> None:
+    first_match = _find_first_match(logs)
+    if expected is None:
+        assert first_match is None
+    else:
+        assert first_match is not None
+        assert first_match.group(0) == expected
+        assert first_match.groups() == (str(PROGRAM_ID), "0x1770")
+
+
+@mark.parametrize(
+    "logs,matches",
+    [
+        ([ERROR_LINE, *NOISE_LINES], True),
+        ([*NOISE_LINES, ERROR_LINE], True),
+        (NOISE_LINES, False),
+    ],
+    ids=["first_line", "later_line", "no_match"],
+)
+def test_extract_code_and_logs(logs: list[str], matches: bool) -> None:
+    extracted = extract_code_and_logs(_preflight_failure(logs), PROGRAM_ID)
+    if matches:
+        assert extracted == (6000, logs)
+    else:
+        assert extracted is None
+
+
+def test_extract_code_and_logs_other_program() -> None:
+    other_program = PublicKey("11111111111111111111111111111111")
+    logs = [*NOISE_LINES, ERROR_LINE]
+    assert extract_code_and_logs(_preflight_failure(logs), other_program) is None